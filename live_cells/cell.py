@@ -7,6 +7,8 @@ class Cell:
 
     """
 
+    __slots__ = ('__weakref__',)
+
     @property
     def value(self):
         """The value of the cell."""
@@ -7,6 +7,8 @@ class ComputeCell(DependentCell):
 
     """
 
+    __slots__ = ('compute',)
+
     def __init__(self, compute, arguments, key=None):
         """Create a computed cell with a given `compute` function and `arguments`.
 
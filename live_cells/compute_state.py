@@ -74,6 +74,7 @@ class ComputeCellState(ObserverCellState):
         """
 
         self._value = v
+        self._version += 1
 
     def init(self):
         super().init()
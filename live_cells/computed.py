@@ -1,8 +1,9 @@
 from .dynamic_compute_cell import DynamicComputeCell
+from .static_compute_cell import StaticComputeCell
 from .exceptions import StopComputeException
 
-def computed(compute=None, key = None, changes_only = False):
-    """Create a computed cell with dynamically determined arguments.
+def computed(compute=None, key = None, changes_only = False, arguments = None):
+    """Create a computed cell with dynamically or statically determined arguments.
 
     A computed cell with compute function ``compute`` is
     created. ``compute`` is a function of no arguments, that is called
@@ -18,6 +19,16 @@ def computed(compute=None, key = None, changes_only = False):
        used as the compute function. The cell is then referenced using
        the name of the decorated function.
 
+    If ``arguments`` is not *None*, the cell's dependencies are the
+    cells in ``arguments`` instead of the cells referenced within
+    ``compute``. This avoids tracking the referenced cells every time
+    the cell's value is computed, and should be used when the cells
+    on which the cell depends are known in advance.
+
+    .. code-block::
+
+       c = computed(lambda: a() + b(), arguments={a, b})
+
     :param compute: Function of no arguments called to compute the
                     value of the cell.
 
@@ -29,16 +40,30 @@ def computed(compute=None, key = None, changes_only = False):
                          observers if its new value is not equal to
                          its previous value. Defaults to *False*.
 
+    :param arguments: The argument cells on which the value of the
+                      cell depends. If *None* (the default) the
+                      arguments are determined dynamically.
+
+    :type arguments: iterable of Cell, optional
+
     :returns: A computed cell.
 
     """
 
     if compute is None:
         def decorator(fn):
-            return computed(fn, key, changes_only)
+            return computed(fn, key, changes_only, arguments)
 
         return decorator
 
+    if arguments is not None:
+        return StaticComputeCell(
+            compute = compute,
+            arguments = set(arguments),
+            key = key,
+            changes_only = changes_only
+        )
+
     return DynamicComputeCell(
         compute = compute,
         key = key,
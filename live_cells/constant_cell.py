@@ -7,6 +7,8 @@ class ConstantCell(Cell):
 
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, value):
         """Create a constant cell holding `value`."""
 
@@ -12,6 +12,8 @@ class DependentCell(Cell):
 
     """
 
+    __slots__ = ('_key', '_arguments')
+
     def __init__(self, arguments, key=None):
         """Create a cell dependent on the cells in `arguments`.
 
@@ -51,12 +53,20 @@ class DependentCell(Cell):
             return True
 
         if isinstance(other, DependentCell):
-            return self.key != None and other.key != None and self.key == other.key
+            return self.key is not None and other.key is not None and self.key == other.key
 
         return NotImplemented
 
     def __hash__(self):
-        return hash(self.key)
+        # Cells without a key are only equal to themselves, so they
+        # are hashed by identity rather than all sharing hash(None).
+
+        key = self.key
+
+        if key is None:
+            return object.__hash__(self)
+
+        return hash(key)
 
 class ObserverWrapper:
     """Wrapper that replaces the cell instance passed to a cell observer."""
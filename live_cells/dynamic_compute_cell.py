@@ -1,6 +1,6 @@
 from .stateful_cell import StatefulCell
 from .compute_state import ComputeCellState
-from .tracking import without_tracker, ArgumentTracker
+from .tracking import without_tracker, push_tracker, pop_tracker
 from .exceptions import StopComputeException
 
 from .changes_only_state import ChangesOnlyState
@@ -8,6 +8,8 @@ from .changes_only_state import ChangesOnlyState
 class DynamicComputeCell(StatefulCell):
     """A computed cell that determines its arguments at runtime."""
 
+    __slots__ = ('_compute', '_changes_only')
+
     def __init__(self, compute, key=None, changes_only=False):
         """Create a computed cell with a given `compute` function.
 
@@ -59,16 +61,27 @@ class DynamicComputeCellState(ComputeCellState):
         )
 
     def track_argument(self, arg):
-        """Register `arg` as a dependency of this cell."""
+        """Register `arg` as a dependency of this cell.
+
+        Returns the value of `arg`.
+
+        """
 
         if arg not in self.arguments:
             arg.add_observer(self)
             self.arguments.add(arg)
 
+        return arg.value
+
     def compute(self):
-        with ArgumentTracker(self.track_argument):
+        push_tracker(self.track_argument)
+
+        try:
             return self.cell._compute()
 
+        finally:
+            pop_tracker()
+
 class DynamicComputeChangesOnlyCellState(ChangesOnlyState, DynamicComputeCellState):
     """A DynamicComputeCellState that checks whether the cell value has changed.
 
@@ -26,12 +26,32 @@ def cell_function(compute=None, key=None):
     @functools.wraps(compute)
     def wrapper(*args):
         return ComputeCell(
-            lambda: compute(*(arg.value for arg in args)), set(args),
+            _apply_values(compute, args), set(args),
             key = key(*args) if key is not None else None
         )
 
     return wrapper
 
+def _apply_values(compute, args):
+    """Return a function that applies `compute` on the values of `args`.
+
+    Functions of one and two arguments, which includes all the
+    operators defined on cells, are applied without building a
+    generator over the argument cells every time the value is
+    computed.
+
+    """
+
+    if len(args) == 1:
+        a, = args
+        return lambda: compute(a.value)
+
+    if len(args) == 2:
+        a, b = args
+        return lambda: compute(a.value, b.value)
+
+    return lambda: compute(*(arg.value for arg in args))
+
 def cell_extension(fn = None, name=None):
     """Add `fn` as a method to all cell objects.
 
@@ -5,18 +5,28 @@ class ValueKey:
     have the same runtime type and the `args` of both instances,
     provided during construction, compare equal.
 
+    The hash of the key is computed once, the first time it is
+    requested, and is then cached.
+
     """
 
     def __init__(self, *args):
         """Create a key distinguished from other keys by the values in `args`."""
 
         self.args = args
+        self._hash = None
 
     def __eq__(self, other):
-        if type(self) == type(other):
+        if self is other:
+            return True
+
+        if type(self) is type(other):
             return self.args == other.args
 
         return NotImplemented
 
     def __hash__(self):
-        return hash(self.args)
+        if self._hash is None:
+            self._hash = hash(self.args)
+
+        return self._hash
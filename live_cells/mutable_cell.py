@@ -1,3 +1,4 @@
+import functools
 from contextlib import contextmanager
 
 from .stateful_cell import CellState
@@ -11,6 +12,8 @@ class MutableCell(PersistentStatefulCell):
 
     """
 
+    __slots__ = ('_value', '_mutable_state')
+
     def __init__(self, value = None, key = None):
         """Create a mutable cell initialized to `value`.
 
@@ -61,7 +64,13 @@ class MutableCellState(CellState):
     ## Batch Update State
 
     _is_batch = False
-    _batched = set()
+    _batched = []
+
+    # Incremented at the start of every batch. A state is only added
+    # to `_batched` if it was not already added during the current
+    # batch, which is the case when its `_batch_epoch` differs.
+
+    _current_batch_epoch = 0
 
     def __init__(self, cell, key, value):
         """Create a mutable cell state with an initial `value`."""
@@ -72,6 +81,7 @@ class MutableCellState(CellState):
         )
 
         self._value = value
+        self._batch_epoch = -1
 
     @property
     def value(self):
@@ -87,16 +97,42 @@ class MutableCellState(CellState):
             self._value = value
             return
 
-        if self.value != value:
-            self.notify_will_update()
-            self._value = value
-
+        if self._is_new_value(value):
             if self.is_batch:
-                self.add_to_batch()
+                # Observers are only notified once per batch, even if
+                # the value is set multiple times.
+
+                if self.add_to_batch():
+                    self.notify_will_update()
+
+                self._value = value
 
             else:
+                self.notify_will_update()
+                self._value = value
                 self.notify_update()
 
+    def _is_new_value(self, value):
+        """Is `value` different from the current value of the cell?
+
+        If `value` is the same object as the current value, it is not
+        a new value, without comparing the two with `!=`.
+
+        If the values cannot be compared, for example because
+        comparing them raises an exception, `value` is considered to be
+        a new value.
+
+        """
+
+        if value is self._value:
+            return False
+
+        try:
+            return bool(self._value != value)
+
+        except Exception:
+            return True
+
     @property
     def is_batch(self):
         """Is a batch update currently in effect?"""
@@ -104,15 +140,29 @@ class MutableCellState(CellState):
         return self._is_batch
 
     def add_to_batch(self):
-        """Adds this state to the current batch's list of modified cell states."""
+        """Adds this state to the current batch's list of modified cell states.
 
-        self._batched.add(self)
+        Returns True if the state was added, False if it was already
+        added during the current batch.
+
+        """
+
+        epoch = MutableCellState._current_batch_epoch
+
+        if self._batch_epoch != epoch:
+            self._batch_epoch = epoch
+            MutableCellState._batched.append(self)
+
+            return True
+
+        return False
 
     @classmethod
     def _begin_batch(cls):
         """Begin a batch update."""
 
         cls._is_batch = True
+        cls._current_batch_epoch += 1
         cls._batched.clear()
 
     @classmethod
@@ -128,10 +178,15 @@ class MutableCellState(CellState):
 
         cls._is_batch = False
 
-        for state in cls._batched:
-            state.notify_update()
+        # An observer may begin a new batch while the states are being
+        # notified, so the list of batched states is replaced before
+        # notifying them.
 
-        cls._batched.clear()
+        batched = MutableCellState._batched
+        MutableCellState._batched = []
+
+        for state in batched:
+            state.notify_update()
 
 def mutable(value = None, key = None):
     """Create a mutable cell with an initial ``value``.
@@ -194,18 +249,28 @@ def batched(fn):
     .. code-block::
 
        with batch():
-           fn()
+           return fn()
 
     :param fn: A function
     :type fn: function
 
-    :returns: A function that calls ``fn`` while applying cell batching.
+    :returns: A function that calls ``fn`` while applying cell batching,
+              and returns the value returned by ``fn``.
     :rtype: function
 
     """
 
+    @functools.wraps(fn)
     def wrapper(*args, **kwargs):
-        with batch():
-            fn(*args, **kwargs)
+        if MutableCellState._is_batch:
+            return fn(*args, **kwargs)
+
+        MutableCellState._begin_batch()
+
+        try:
+            return fn(*args, **kwargs)
+
+        finally:
+            MutableCellState._end_batch()
 
     return wrapper
@@ -20,6 +20,8 @@ def peek(self):
 class PeekCell(Cell):
     """A cell that has the same value as another cell but does not notify its observers."""
 
+    __slots__ = ('_cell',)
+
     def __init__(self, cell):
         """Create a PeekCell that evaluates to the value of `cell`."""
 
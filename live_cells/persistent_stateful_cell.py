@@ -18,6 +18,8 @@ class PersistentStatefulCell(StatefulCell):
 
     """
 
+    __slots__ = ()
+
     @property
     def state(self):
         if self.key is None:
@@ -1,4 +1,5 @@
 import logging
+import sys
 
 from .cell import Cell
 
@@ -14,15 +15,20 @@ class StatefulCell(Cell):
 
     """
 
+    __slots__ = ('key', '_state')
+
     def __init__(self, key=None):
         """Create a StatefulCell identified by `key`.
 
         If `key` is None, it does not share its state with any other
         cell.
 
+        String keys are interned, so that looking up the shared state
+        of a cell usually compares keys by identity.
+
         """
 
-        self.key = key
+        self.key = sys.intern(key) if type(key) is str else key
         self._state = None
 
     @property
@@ -55,12 +61,20 @@ class StatefulCell(Cell):
             return True
 
         if isinstance(other, StatefulCell):
-            return self.key != None and other.key != None and self.key == other.key
+            return self.key is not None and other.key is not None and self.key == other.key
 
         return NotImplemented
 
     def __hash__(self):
-        return hash(self.key)
+        # Cells without a key are only equal to themselves, so they
+        # are hashed by identity rather than all sharing hash(None).
+
+        key = self.key
+
+        if key is None:
+            return object.__hash__(self)
+
+        return hash(key)
 
     # Private
 
@@ -68,7 +82,11 @@ class StatefulCell(Cell):
         """Retrieve the cell's state, creating it if necessary."""
 
         if self._state is None or self._state.disposed:
-            self._state = GlobalStateMap.instance.get(self.key, self.create_state)
+            if self.key is None:
+                self._state = self.create_state()
+
+            else:
+                self._state = GlobalStateMap.instance.get(self.key, self.create_state)
 
         return self._state
 
@@ -76,7 +94,11 @@ class StatefulCell(Cell):
         """Retrieve the cell's state if it has been created."""
 
         if self._state is None or self._state.disposed:
-            self._state = GlobalStateMap.instance.maybe_get(self.key)
+            if self.key is None:
+                self._state = None
+
+            else:
+                self._state = GlobalStateMap.instance.maybe_get(self.key)
 
         return self._state
 
@@ -104,9 +126,11 @@ class CellState:
         self.key = key
 
         self._observers = {}
+        self._observer_tuple = None
         self._disposed = False
 
         self._notify_count = 0
+        self._version = 0
 
     @property
     def disposed(self):
@@ -118,6 +142,21 @@ class CellState:
 
         return self._disposed
 
+    @property
+    def version(self):
+        """Counter which is incremented whenever the cell's value may have changed.
+
+        The version is incremented when the observers are notified
+        that the value will change, when they are notified that it has
+        changed, and when the value of the state is set directly.
+
+        If the version has not changed, the value of the cell has not
+        changed either.
+
+        """
+
+        return self._version
+
     def init(self):
         """Called before the first observer is added.
 
@@ -137,7 +176,9 @@ class CellState:
         """
 
         self._disposed = True
-        GlobalStateMap.instance.remove(self.key)
+
+        if self.key is not None:
+            GlobalStateMap.instance.remove(self.key)
 
     def add_observer(self, observer):
         """Add an observer."""
@@ -147,7 +188,11 @@ class CellState:
         if not self._observers:
             self.init()
 
-        self._observers[observer] = self._observers.get(observer, 0) + 1
+        count = self._observers.get(observer, 0)
+        self._observers[observer] = count + 1
+
+        if count == 0:
+            self._observer_tuple = None
 
     def remove_observer(self, observer):
         """Remove an observer."""
@@ -162,6 +207,7 @@ class CellState:
 
             else:
                 del self._observers[observer]
+                self._observer_tuple = None
 
                 if not self._observers:
                     self.dispose()
@@ -181,7 +227,12 @@ class CellState:
         This indicates a bug in live_cells unless the error originates
         from a cell class provided by third-party code.'''
 
-        for observer in self._observers.copy():
+        # The value may change before `notify_update` is called, for
+        # example a mutable cell set during a batch update.
+
+        self._version += 1
+
+        for observer in self._get_observer_tuple():
             try:
                 observer.will_update(self.cell)
 
@@ -209,7 +260,10 @@ class CellState:
         self._notify_count -= 1
         assert self._notify_count >= 0
 
-        for observer in self._observers.copy():
+        if did_change:
+            self._version += 1
+
+        for observer in self._get_observer_tuple():
             try:
                 observer.update(self.cell, did_change)
 
@@ -217,6 +271,20 @@ class CellState:
                 logging.debug('Exception raised by observer.update()',
                               exc_info=True)
 
+    def _get_observer_tuple(self):
+        """Retrieve a tuple of the observers to notify.
+
+        The tuple is cached until an observer is added or removed. Since
+        it is not modified while it is being iterated over, observers
+        may safely be added or removed during notification.
+
+        """
+
+        if self._observer_tuple is None:
+            self._observer_tuple = tuple(self._observers)
+
+        return self._observer_tuple
+
 class GlobalStateMap:
     """Mas cell keys to shared cell states."""
 
@@ -242,15 +310,17 @@ class GlobalStateMap:
         created, `create()` is called to create it and the resulting
         state is stored in the map.
 
+        `key` must not be None. Cells without a key do not share their
+        state, and create it without going through this map.
+
         """
 
-        if key is None:
-            return create()
+        state = self.states.get(key)
 
-        if key not in self.states:
-            self.states[key] = create()
+        if state is None:
+            state = self.states[key] = create()
 
-        return self.states[key]
+        return state
 
     def maybe_get(self, key):
         """Retrieve the state for the cell identified by `key`.
@@ -265,5 +335,4 @@ class GlobalStateMap:
     def remove(self, key):
         """Remove the state for the cell identified by `key` from the map."""
 
-        if key in self.states:
-            del self.states[key]
+        self.states.pop(key, None)
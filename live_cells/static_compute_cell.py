@@ -0,0 +1,87 @@
+from .stateful_cell import StatefulCell
+from .compute_state import ComputeCellState
+from .tracking import without_tracker
+from .exceptions import StopComputeException
+
+from .changes_only_state import ChangesOnlyState
+
+class StaticComputeCell(StatefulCell):
+    """A computed cell with a fixed set of argument cells.
+
+    Unlike `DynamicComputeCell`, the arguments of this cell are
+    provided when it is created, and are not determined by tracking
+    the cells referenced within the compute function.
+
+    """
+
+    __slots__ = ('_compute', '_arguments', '_changes_only')
+
+    def __init__(self, compute, arguments, key=None, changes_only=False):
+        """Create a computed cell with a given `compute` function and `arguments`.
+
+        `compute` is a function of no arguments that is called to
+        compute the value of the cell. `arguments` is the set of cells
+        on which the value of the cell depends. The cell is recomputed
+        whenever the value of at least one of these cells changes.
+
+        The cell is identified by `key` if it is not None.
+
+        If `changes_only` is True, the cell only notifies its
+        observers if its value has actually changed.
+
+        """
+
+        super().__init__(key=key)
+
+        self._compute = compute
+        self._arguments = arguments
+        self._changes_only = changes_only
+
+    @property
+    def arguments(self):
+        """Set of cells on which the value of this cell depends."""
+
+        return self._arguments
+
+    @property
+    @without_tracker
+    def value(self):
+        state = self.state
+
+        if state is None:
+            try:
+                return self._compute()
+
+            except StopComputeException as e:
+                return e.default_value
+
+        return state.value
+
+    def create_state(self):
+        if self._changes_only:
+            return StaticComputeChangesOnlyCellState(self, self.key)
+
+        return StaticComputeCellState(self, self.key)
+
+class StaticComputeCellState(ComputeCellState):
+    """Maintains the state of a StaticComputeCell."""
+
+    def __init__(self, cell, key):
+        super().__init__(
+            cell = cell,
+            key = key,
+            arguments = cell.arguments
+        )
+
+    def compute(self):
+        return self.cell._compute()
+
+class StaticComputeChangesOnlyCellState(ChangesOnlyState, StaticComputeCellState):
+    """A StaticComputeCellState that checks whether the cell value has changed.
+
+    This state only notifies the observers of the cell, if the new
+    value of the cell is not equal to the previous value.
+
+    """
+
+    pass
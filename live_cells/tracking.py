@@ -44,20 +44,13 @@ class ArgumentTracker:
 
         """
 
-        tracker = cls._tracker
+        tracker = getattr(cls._data, 'track', None)
 
         if tracker is not None:
             return tracker(arg)
 
         return arg.value
 
-    @classmethod
-    @property
-    def _tracker(cls):
-        """The argument cell tracker callback currently in effect."""
-
-        return cls._data.track if hasattr(cls._data, 'track') else None
-
     def __init__(self, tracker, override=False):
         def track_fn(cell):
             tracker(cell)
@@ -66,11 +59,39 @@ class ArgumentTracker:
         self._tracker = tracker if (override or tracker is None) else track_fn
 
     def __enter__(self):
-        self._previous = ArgumentTracker._tracker
-        ArgumentTracker._data.track = self._tracker
+        push_tracker(self._tracker)
 
     def __exit__(self, exception_type, exception_value, exception_traceback):
-        ArgumentTracker._data.track = self._previous
+        pop_tracker()
+
+def push_tracker(tracker):
+    """Install `tracker` as the cell argument tracker for the current thread.
+
+    Unlike `ArgumentTracker`, the value returned by `tracker` is used
+    as the value of the referenced cell, thus `tracker` is responsible
+    for retrieving the value of the cell.
+
+    The previous tracker is saved and restored by a subsequent call to
+    `pop_tracker()`. Calls to `push_tracker()` and `pop_tracker()`
+    must be balanced.
+
+    """
+
+    data = ArgumentTracker._data
+
+    try:
+        data.stack.append(data.track)
+
+    except AttributeError:
+        data.stack = [getattr(data, 'track', None)]
+
+    data.track = tracker
+
+def pop_tracker():
+    """Restore the tracker that was in effect before the last call to `push_tracker()`."""
+
+    data = ArgumentTracker._data
+    data.track = data.stack.pop()
 
 def with_tracker(tracker):
     """Install a cell dependency `tracker` to be in effect within the decorated function.
@@ -1,8 +1,9 @@
 import logging
 
-from .tracking import ArgumentTracker, without_tracker
+from .tracking import push_tracker, pop_tracker, without_tracker
 from .exceptions import StopComputeException
 from .maybe import Maybe
+from .stateful_cell import StatefulCell
 
 class CellWatcher:
     """Maintains the state of a cell watch function."""
@@ -65,6 +66,8 @@ class CellWatchObserver:
         self.arguments = set()
         self.updating = False
 
+        self._argument_values = {}
+
         self.waiting_for_change = False
 
         self.call_watch()
@@ -76,15 +79,22 @@ class CellWatchObserver:
             arg.remove_observer(self)
 
         self.arguments.clear()
+        self._argument_values.clear()
 
 
     def track_argument(self, arg):
-        """Track cell `arg` as a dependency of the watch function."""
+        """Track cell `arg` as a dependency of the watch function.
+
+        Returns the value of `arg`.
+
+        """
 
         if arg not in self.arguments:
             arg.add_observer(self)
             self.arguments.add(arg)
 
+        return arg.value
+
     def call_watch(self):
         """Call the watch function scheduling it if necessary."""
 
@@ -92,9 +102,14 @@ class CellWatchObserver:
             self.schedule_call()
 
         else:
-            with ArgumentTracker(self.track_argument):
+            push_tracker(self.track_argument)
+
+            try:
                 self.call_callback()
 
+            finally:
+                pop_tracker()
+
     def call_callback(self):
         """Call the watch function."""
 
@@ -112,21 +127,50 @@ class CellWatchObserver:
     def schedule_call(self):
         """Schedule a call to the watch function callback, using ``self.schedule``."""
 
-        arg_values = {arg: Maybe.wrap(without_tracker(lambda: arg.value)) for arg in self.arguments}
+        arg_values = {arg: self.wrap_argument(arg) for arg in self.arguments}
 
         def bind_args(arg):
             if arg in arg_values:
                 return arg_values[arg].unwrap()
 
-            self.track_argument(arg)
-            return arg.value
+            return self.track_argument(arg)
 
         def callback():
-            with ArgumentTracker(bind_args, override=True):
+            push_tracker(bind_args)
+
+            try:
                 return self.call_callback()
 
+            finally:
+                pop_tracker()
+
         self.schedule(callback)
 
+    def wrap_argument(self, arg):
+        """Wrap the value of argument cell `arg` in a `Maybe`.
+
+        If `arg` is a stateful cell and its value has not changed
+        since it was last wrapped, the previous `Maybe` is returned.
+        This relies on the state's `version` being incremented
+        whenever its value may have changed.
+
+        """
+
+        state = arg.state if isinstance(arg, StatefulCell) else None
+
+        if state is not None:
+            entry = self._argument_values.get(state)
+
+            if entry is not None and entry[0] == state.version:
+                return entry[1]
+
+        value = Maybe.wrap(without_tracker(lambda: arg.value))
+
+        if state is not None:
+            self._argument_values[state] = (state.version, value)
+
+        return value
+
     # Cell Observer Methods
 
     def will_update(self, cell):
@@ -8,15 +8,18 @@ def test_watch():
 
     watchers = []
 
-    def decorator(fn=None, *args, **kwargs):
-        if fn is None:
-            return lambda f: decorator(f, *args, **kwargs)
-
+    def register(fn, *args, **kwargs):
         watcher = watch(fn, *args, **kwargs)
         watchers.append(watcher)
 
         return watcher
 
+    def decorator(fn=None, *args, **kwargs):
+        if fn is None:
+            return lambda f: register(f, *args, **kwargs)
+
+        return register(fn, *args, **kwargs)
+
     yield decorator
 
     for watcher in watchers:
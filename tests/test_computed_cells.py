@@ -331,3 +331,110 @@ class TestDynamicComputedCell:
         with observe(f()):
             assert counter.count_init == 2
             assert counter.count_dispose == 1
+
+class TestStaticComputedCell:
+    """Tests the behaviour of a computed cell with a fixed set of arguments."""
+
+    def test_function_on_constant(self):
+        """Test a basic function applied on a constant cell."""
+
+        a = value(1)
+        b = computed(lambda: a() + 1, arguments={a})
+
+        assert b.value == 2
+
+    def test_recompute_when_all_argument_change(self):
+        """Test that the cell is recomputed when all the arguments change."""
+
+        a = mutable(1)
+        b = mutable(1)
+
+        c = computed(lambda: a() + b(), arguments={a, b})
+
+        observer = ValueTestObserver()
+
+        with observe(c, observer):
+            a.value = 5
+            b.value = 8
+            a.value = 100
+
+            assert observer.values == [6, 13, 108]
+
+    def test_only_given_arguments_observed(self):
+        """Test that cells not given in the arguments are not observed."""
+
+        a = mutable(1)
+        b = mutable(1)
+
+        c = computed(lambda: a() + b(), arguments={a})
+
+        observer = ValueTestObserver()
+
+        with observe(c, observer):
+            b.value = 8
+            a.value = 5
+
+            assert observer.values == [13]
+
+    def test_arguments_not_tracked_by_enclosing_cell(self):
+        """Test that the cells referenced in the compute function are not tracked by an enclosing computed cell."""
+
+        a = mutable(1)
+        b = mutable(1)
+
+        c = computed(lambda: a() + b(), arguments={a})
+        d = computed(lambda: c() * 10)
+
+        observer = ValueTestObserver()
+
+        with observe(d, observer):
+            b.value = 2
+            a.value = 2
+
+            assert observer.values == [40]
+
+    def test_none_preserves_previous_value(self):
+        """Test that the previous value is preserved when none() is used."""
+
+        a = mutable(0)
+        evens = computed(lambda: a() if a() % 2 == 0 else none(), arguments={a})
+
+        observer = ValueTestObserver()
+
+        with observe(evens, observer):
+            a.value = 1
+            a.value = 2
+            a.value = 3
+            a.value = 4
+
+        assert observer.values == [0, 2, 4]
+
+    def test_decorator(self):
+        """Test defining a cell with fixed arguments using the `computed` decorator."""
+
+        a = mutable(2)
+        b = mutable(3)
+
+        @computed(arguments={a, b})
+        def c():
+            return a() * b()
+
+        observer = ValueTestObserver()
+
+        with observe(c, observer):
+            a.value = 4
+            b.value = 5
+
+            assert observer.values == [12, 20]
+
+    def test_compares_equal(self):
+        """Test that two cells with the same keys compare equal."""
+
+        a = mutable(0)
+        b = mutable(0)
+
+        c1 = computed(lambda: a() + b(), key='theKey', arguments={a, b})
+        c2 = computed(lambda: a() + b(), key='theKey', arguments={a, b})
+
+        assert c1 == c2
+        assert hash(c1) == hash(c2)
@@ -288,3 +288,43 @@ class TestErrorHandlingExtension:
         assert e1 != e2
         assert e1 == e1
         assert e1 == e3
+
+    def test_on_error_referenced_in_computed_cell(self):
+        """Test that a cell created with on_error() inside a computed cell is tracked only once."""
+
+        a = mutable(1)
+        b = mutable(2)
+
+        c = computed(lambda: a.on_error(b)() * 10)
+
+        observer = ValueTestObserver()
+
+        with observe(c, observer):
+            for i in range(2, 202):
+                a.value = i
+
+            assert observer.values == [i * 10 for i in range(2, 202)]
+            assert len(c.state.arguments) == 1
+
+    def test_error_referenced_in_computed_cell(self):
+        """Test that a cell created with error() inside a computed cell is tracked only once."""
+
+        a = mutable(1)
+
+        @computed
+        def b():
+            if a() <= 0:
+                raise MockException()
+
+            return a()
+
+        c = computed(lambda: b.error(all=True)() is not None)
+
+        observer = ValueTestObserver()
+
+        with observe(c, observer):
+            for i in range(100):
+                a.value = -1 if i % 2 == 0 else 1
+
+            assert observer.values == [True, False] * 50
+            assert len(c.state.arguments) == 1
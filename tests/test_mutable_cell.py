@@ -1,4 +1,6 @@
-from live_cells import mutable, batch, batched, computed
+import weakref
+
+from live_cells import mutable, batch, batched, computed, value
 from live_cells.stateful_cell import GlobalStateMap
 
 from util import observe, CountTestObserver, ValueTestObserver
@@ -65,6 +67,46 @@ def test_new_value_equals_old_value():
 
         assert observer.count_update == 0
 
+def test_new_value_not_comparable():
+    """Test that observers are notified when the new value cannot be compared to the old value."""
+
+    class Incomparable:
+        def __eq__(self, other):
+            raise TypeError
+
+        def __ne__(self, other):
+            raise TypeError
+
+    cell = mutable(Incomparable())
+    observer = CountTestObserver()
+
+    with observe(cell, observer):
+        value = Incomparable()
+        cell.value = value
+
+        assert observer.count_update == 1
+        assert cell.value is value
+
+def test_same_value_object():
+    """Test that observers are not called when the new value is the same object as the old value."""
+
+    class AlwaysDifferent:
+        def __eq__(self, other):
+            return False
+
+        def __ne__(self, other):
+            return True
+
+    value = AlwaysDifferent()
+
+    cell = mutable(value)
+    observer = CountTestObserver()
+
+    with observe(cell, observer):
+        cell.value = value
+
+        assert observer.count_update == 0
+
 def test_all_observers_notified():
     """Test that all observers are notified."""
 
@@ -124,6 +166,108 @@ def test_batch_update():
 
         assert observer.values == ['1 + 2 = 3', '5 plus 6 = 11']
 
+def test_batched_return_value():
+    """Test that a batched function returns the value returned by the decorated function."""
+
+    a = mutable(0)
+    b = mutable(0)
+
+    observer = ValueTestObserver()
+    sum = computed(lambda: a() + b())
+
+    with observe(sum, observer):
+        @batched
+        def set_cells(x, y):
+            """Set the values of a and b."""
+
+            a.value = x
+            b.value = y
+
+            return x + y
+
+        assert set_cells(1, 2) == 3
+        assert set_cells.__name__ == 'set_cells'
+        assert set_cells.__doc__ == 'Set the values of a and b.'
+        assert observer.values == [3]
+
+def test_batch_update_computes_once():
+    """Test that a computed cell is computed once when multiple arguments change during a batch update."""
+
+    a = mutable(0)
+    b = mutable(0)
+
+    count = 0
+
+    @computed
+    def sum():
+        nonlocal count
+        count += 1
+
+        return a() + b()
+
+    observer = ValueTestObserver()
+
+    with observe(sum, observer):
+        count = 0
+
+        with batch():
+            a.value = 1
+            b.value = 2
+            a.value = 3
+
+        assert count == 1
+        assert observer.values == [5]
+
+def test_batch_update_same_cell_twice():
+    """Test that observers are notified once when a cell is set twice during a batch update."""
+
+    a = mutable(0)
+    b = computed(lambda: a() + 1)
+
+    observer = CountTestObserver()
+    values = ValueTestObserver()
+
+    with observe(b, observer), observe(b, values):
+        with batch():
+            a.value = 1
+            a.value = 2
+
+        assert observer.count_will_update == 1
+        assert observer.count_update == 1
+
+        a.value = 5
+
+        assert values.values == [3, 6]
+
+def test_batch_started_by_observer_during_batch_update(test_watch):
+    """Test that all observers are notified when an observer starts a new batch while a batch update is being applied."""
+
+    a = mutable(0)
+    b = mutable(0)
+    x = mutable(0)
+
+    s = computed(lambda: a() + b())
+
+    values = []
+
+    @test_watch
+    def copy_a():
+        with batch():
+            x.value = a()
+
+    @test_watch
+    def record_s():
+        values.append(s())
+
+    with batch():
+        a.value = 1
+        b.value = 2
+
+    a.value = 10
+
+    assert x.value == 10
+    assert values == [0, 3, 12]
+
 def test_compares_equal():
     """Test that two cells compare equal when they have the same keys."""
 
@@ -152,6 +296,16 @@ def test_compares_not_equal_none_keys():
     assert a != b
     assert a == a
 
+def test_hash_none_keys():
+    """Test that cells with None keys are hashed by identity."""
+
+    a = mutable(0)
+    b = mutable(0)
+
+    assert hash(a) == hash(a)
+    assert hash(a) != hash(b)
+    assert len({a, b, a}) == 2
+
 def test_state_sharing():
     """Test that cells with the same key share the same state."""
 
@@ -264,3 +418,14 @@ def test_no_leaks():
         assert GlobalStateMap.instance.maybe_get('mutable-cell-key1') is not None
 
     assert GlobalStateMap.instance.maybe_get('mutable-cell-key1') is None
+
+def test_weak_reference():
+    """Test that cells can be weakly referenced."""
+
+    a = mutable(1)
+    b = computed(lambda: a() + 1)
+    c = value(3)
+
+    assert weakref.ref(a)() is a
+    assert weakref.ref(b)() is b
+    assert weakref.ref(c)() is c
@@ -195,6 +195,155 @@ class TestCellWatcher:
         assert calls[2]() == (23, 10)
         assert calls[3]() == (23, 33)
 
+    def test_schedule_computed_arguments(self, test_watch):
+        """Test watch function scheduling with computed argument cells."""
+
+        a = mutable(0)
+        b = mutable(1)
+        c = computed(lambda: a() + b())
+
+        calls = []
+        first = True
+
+        def schedule(f):
+            nonlocal first
+
+            if first:
+                first = False
+                f()
+
+            else:
+                calls.append(f)
+
+        @test_watch(schedule = schedule)
+        def watch_ac():
+            return (a(), c())
+
+        a.value = 5
+        b.value = 10
+        b.value = 20
+
+        assert len(calls) == 3
+
+        assert calls[0]() == (5, 6)
+        assert calls[1]() == (5, 15)
+        assert calls[2]() == (5, 25)
+
+    def test_schedule_unchanged_argument(self, test_watch):
+        """Test watch function scheduling when only some of the arguments change."""
+
+        a = mutable(0)
+        b = mutable(1)
+        c = computed(lambda: b() * 2)
+
+        calls = []
+        first = True
+
+        def schedule(f):
+            nonlocal first
+
+            if first:
+                first = False
+                f()
+
+            else:
+                calls.append(f)
+
+        @test_watch(schedule = schedule)
+        def watch_abc():
+            return (a(), b(), c())
+
+        a.value = 5
+        a.value = 6
+        b.value = 2
+        a.value = 7
+
+        assert len(calls) == 4
+
+        assert calls[0]() == (5, 1, 2)
+        assert calls[1]() == (6, 1, 2)
+        assert calls[2]() == (6, 2, 4)
+        assert calls[3]() == (7, 2, 4)
+
+    def test_schedule_batch(self, test_watch):
+        """Test watch function scheduling with arguments changed during a batch update."""
+
+        a = mutable(0)
+        b = mutable(1)
+        c = computed(lambda: b() + 10)
+
+        calls = []
+        first = True
+
+        def schedule(f):
+            nonlocal first
+
+            if first:
+                first = False
+                f()
+
+            else:
+                calls.append(f)
+
+        @test_watch(schedule = schedule)
+        def watch_abc():
+            return (a(), b(), c())
+
+        a.value = 5
+
+        with batch():
+            a.value = 6
+            b.value = 7
+
+        assert len(calls) == 2
+
+        assert calls[0]() == (5, 1, 11)
+        assert calls[1]() == (6, 7, 17)
+
+    def test_schedule_reuses_unchanged_argument_value(self, test_watch):
+        """Test that the value of an unchanged argument is not read again for each scheduled call."""
+
+        class ReadCountCell(LifecycleTestCell):
+            reads = 0
+
+            @property
+            def value(self):
+                ReadCountCell.reads += 1
+                return super().value
+
+        a = mutable(0)
+        b = ReadCountCell(1, LifecycleCounter())
+
+        calls = []
+        first = True
+
+        def schedule(f):
+            nonlocal first
+
+            if first:
+                first = False
+                f()
+
+            else:
+                calls.append(f)
+
+        @test_watch(schedule = schedule)
+        def watch_ab():
+            return (a(), b())
+
+        a.value = 1
+        reads = ReadCountCell.reads
+
+        a.value = 2
+        a.value = 3
+
+        assert ReadCountCell.reads == reads
+
+        assert calls[0]() == (1, 1)
+        assert calls[1]() == (2, 1)
+        assert calls[2]() == (3, 1)
+
+        assert ReadCountCell.reads == reads
 
 class TestChangesOnly:
     """Test the changesOnly option"""
@@ -202,7 +351,7 @@ class TestChangesOnly:
     def test_watch_not_called_when_value_unchanged(self, test_watch):
         """Test that the watch function is not called when the value has not changed."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
 
         track = WatchTracker()
@@ -211,14 +360,14 @@ class TestChangesOnly:
         def watch_b():
             track.add(b())
 
-        a.value = [4, 2, 6]
+        a.value = (4, 2, 6)
 
         assert track.values == [2]
 
     def test_watch_not_called_when_value_unchanged_in_batch(self, test_watch):
         """Test that the watch function is not called when the value has not changed with batch()."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
 
         track = WatchTracker()
@@ -228,7 +377,7 @@ class TestChangesOnly:
             track.add(b())
 
         with batch():
-            a.value = [4, 2, 6]
+            a.value = (4, 2, 6)
 
         assert track.values == [2]
 
@@ -241,7 +390,7 @@ class TestChangesOnly:
 
         """
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
 
         track = WatchTracker()
@@ -250,15 +399,15 @@ class TestChangesOnly:
         def watch_b():
             track.add(b())
 
-        a.value = [4, 2, 6]
-        a.value = [7, 8, 9]
+        a.value = (4, 2, 6)
+        a.value = (7, 8, 9)
 
         assert track.values == [2, 8]
 
     def test_watch_called_when_one_argument_changes(self, test_watch):
         """Test that the watch function is called when at least one argument changes."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
 
         c = mutable(3)
@@ -270,7 +419,7 @@ class TestChangesOnly:
             track.add((b(), c()))
 
         with batch():
-            a.value = [4, 2, 6]
+            a.value = (4, 2, 6)
             c.value = 5
 
         assert track.values == [(2, 3), (2, 5)]
@@ -278,7 +427,7 @@ class TestChangesOnly:
     def test_computed_cell_not_recomputed_when_arguments_not_changed(self, test_watch):
         """Test that the value of a computed cell is not recomputed when none of the arguments change."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
         c = computed(lambda: b() * 10)
 
@@ -288,14 +437,14 @@ class TestChangesOnly:
         def watch_c():
             track.add(c())
 
-        a.value = [4, 2, 6]
+        a.value = (4, 2, 6)
 
         assert track.values == [20]
 
     def test_computed_cell_not_recomputed_when_arguments_not_changed_in_batch(self, test_watch):
         """Test that the value of a computed cell is not recomputed when none of the arguments change in batch()."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
         c = computed(lambda: b() * 10)
 
@@ -306,7 +455,7 @@ class TestChangesOnly:
             track.add(c())
 
         with batch():
-            a.value = [4, 2, 6]
+            a.value = (4, 2, 6)
 
         assert track.values == [20]
 
@@ -319,7 +468,7 @@ class TestChangesOnly:
 
         """
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
         c = computed(lambda: b() * 10)
 
@@ -329,15 +478,15 @@ class TestChangesOnly:
         def watch_c():
             track.add(c())
 
-        a.value = [4, 2, 6]
-        a.value = [7, 8, 9]
+        a.value = (4, 2, 6)
+        a.value = (7, 8, 9)
 
         assert track.values == [20, 80]
 
     def test_computed_cell_recomputed_when_one_argument_changes(self, test_watch):
         """Test that the value of a computed cell is recomputed when the only one argument changes."""
 
-        a = mutable([1, 2, 3])
+        a = mutable((1, 2, 3))
         b = computed(lambda: a()[1], changes_only=True)
 
         c = mutable(3)
@@ -350,7 +499,7 @@ class TestChangesOnly:
             track.add(d())
 
         with batch():
-            a.value = [4, 2, 6]
+            a.value = (4, 2, 6)
             c.value = 5
 
         assert track.values == [6, 10]
@@ -1,6 +1,6 @@
 ## Utilities used for testing
 
-from contextlib import contextmanager
+from contextlib import suppress
 
 from live_cells.stateful_cell import StatefulCell, CellState
 
@@ -14,6 +14,8 @@ class CountTestObserver:
 
     """
 
+    __slots__ = ('count_will_update', 'count_update')
+
     def __init__(self):
         self.count_will_update = 0
         self.count_update = 0
@@ -34,6 +36,8 @@ class ValueTestObserver:
 
     """
 
+    __slots__ = ('values', '_updating', '_notify_count', '_did_change')
+
     def __init__(self):
         self.values = []
 
@@ -66,10 +70,12 @@ class ValueTestObserver:
                     try:
                         value = cell.value
 
-                        if not self.values or self.values[-1] != value:
-                            self.values.append(value)
+                        values = self.values
+
+                        if not values or (values[-1] is not value and values[-1] != value):
+                            values.append(value)
 
-                    except:
+                    except Exception:
                         pass
 
 class LifecycleCounter:
@@ -137,13 +143,38 @@ class MockException(Exception):
 
     pass
 
-@contextmanager
-def observe(cell, observer=CountTestObserver()):
+class ObserveContext:
+    """Context manager which observes a cell for the lifetime of the context.
+
+    See `observe`.
+
+    """
+
+    __slots__ = ('_cell', '_observer')
+
+    def __init__(self, cell, observer):
+        self._cell = cell
+        self._observer = observer
+
+    def __enter__(self):
+        cell = self._cell
+        cell.add_observer(self._observer)
+
+        # Compute value to ensure cell is active
+        with suppress(Exception):
+            cell.value
+
+        return self._observer
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._cell.remove_observer(self._observer)
+
+def observe(cell, observer=None):
     """Add an `observer` to `cell` for the lifetime of a managed context.
 
-    This is a context manager that adds the observer `observer` to
-    `cell`, when entering the `with` block, and automatically removes
-    it when exiting the context.
+    This returns a context manager that adds the observer `observer`
+    to `cell`, when entering the `with` block, and automatically
+    removes it when exiting the context.
 
     ```
     observer = CountTestObserver()
@@ -153,19 +184,11 @@ def observe(cell, observer=CountTestObserver()):
        ...
     ```
 
-    """
-
-    cell.add_observer(observer)
+    If `observer` is None, a new `CountTestObserver` is used.
 
-    # Compute value to ensure cell is active
-    try:
-        cell.value
-
-    except:
-        pass
+    """
 
-    try:
-        yield observer
+    if observer is None:
+        observer = CountTestObserver()
 
-    finally:
-        cell.remove_observer(observer)
+    return ObserveContext(cell, observer)